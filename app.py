@@ -7,11 +7,13 @@ This is the composition root that wires together all modules:
 - Simulation engine
 - UI components
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import streamlit as st
 
 from src.data_loader import load_json, load_data
 from src.strategies import get_all_strategies
-from src.simulation import run_backtest
+from src.simulation import run_backtest, BacktestConfigError, BacktestDataError
 from src.ui import (
     render_config_card,
     render_results_summary,
@@ -69,27 +71,41 @@ def main():
         # Get all registered strategies
         strategies = get_all_strategies()
 
-        # Run backtests
-        results = []
+        # Run backtests concurrently (numeric kernels release the GIL)
+        completed = {}
         progress_bar = st.progress(0)
         status_text = st.empty()
+        status_text.text(f"Running {len(strategies)} strategies...")
 
-        for i, (name, strategy_func) in enumerate(strategies.items()):
-            status_text.text(f"Running {name}...")
-            progress_bar.progress((i + 1) / len(strategies))
-
-            try:
-                result = run_backtest(
+        with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+            futures = {
+                executor.submit(
+                    run_backtest,
                     market_df=market_data,
                     strategy_func=strategy_func,
                     strategy_name=name,
                     config=config,
                     initial_capital=initial_capital,
                     monthly_contribution=monthly_contribution,
-                )
-                results.append(result)
-            except Exception as e:
-                st.warning(f"⚠️ Error running {name}: {e}")
+                ): name
+                for name, strategy_func in strategies.items()
+            }
+
+            # Streamlit calls stay on the script thread
+            for i, future in enumerate(as_completed(futures)):
+                name = futures[future]
+                status_text.text(f"Finished {name}")
+                progress_bar.progress((i + 1) / len(strategies))
+
+                # Only expected input problems are reported here; anything else is a bug
+                # and propagates so Streamlit shows the traceback
+                try:
+                    completed[name] = future.result()
+                except (BacktestConfigError, BacktestDataError) as e:
+                    st.warning(f"⚠️ Error running {name}: {e}")
+
+        # Keep results in registration order regardless of completion order
+        results = [completed[name] for name in strategies if name in completed]
 
         progress_bar.empty()
         status_text.empty()
@@ -0,0 +1,68 @@
+"""
+Ahead-of-time build of the Numba kernels.
+
+Run once at build/deploy time from the repository root:
+
+    python scripts/compile_aot.py
+
+Each package gets its own extension module next to its kernel sources:
+- src/domain/_aot_metrics      from src/domain/_fast_metrics.py
+- src/simulation/_aot_kernels  from src/simulation/_kernels.py
+
+finance_math.py and vectorized.py import these when present, so Streamlit reruns
+skip JIT compilation entirely. Each module records a hash of its source, and a
+module built from older source is ignored (with a warning) in favour of `njit`.
+"""
+import sys
+from pathlib import Path
+
+from numba.pycc import CC
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.domain import _fast_metrics  # noqa: E402
+from src.simulation import _kernels  # noqa: E402
+from src.jit import source_stamp  # noqa: E402
+
+
+def _export_stamp(cc: CC, source_path: str) -> None:
+    """Export `source_stamp()` so load_aot can reject builds of older kernel sources."""
+    stamp = source_stamp(source_path)
+
+    def stamp_func():
+        return stamp
+
+    cc.export('source_stamp', 'i8()')(stamp_func)
+
+
+def build_metrics(output_dir: Path = ROOT / 'src' / 'domain') -> None:
+    """Compile the finance_math kernels into `_aot_metrics` under output_dir."""
+    cc = CC('_aot_metrics')
+    cc.output_dir = str(output_dir)
+
+    # Export the pure-Python sources so the build never depends on a previous build
+    cc.export('irr_newton', 'f8(f8[:], f8[:], i8, f8)')(_fast_metrics.irr_newton.py_func)
+    cc.export('summarize', 'Tuple((f8, f8, f8[:]))(f8[:])')(_fast_metrics.summarize.py_func)
+    _export_stamp(cc, _fast_metrics.__file__)
+
+    cc.compile()
+
+
+def build_kernels(output_dir: Path = ROOT / 'src' / 'simulation') -> None:
+    """Compile the vectorized.py kernels into `_aot_kernels` under output_dir."""
+    cc = CC('_aot_kernels')
+    cc.output_dir = str(output_dir)
+
+    cc.export(
+        'smart_adjust_path',
+        'void(f8[:], f8[:], i8[:], i8[:], f8, f8, f8, f8, f8, f8, f8, f8[:], f8[:], f8[:])',
+    )(_kernels.smart_adjust_path.py_func)
+    _export_stamp(cc, _kernels.__file__)
+
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build_metrics()
+    build_kernels()
@@ -3,9 +3,13 @@ JSON data source adapter for loading price history.
 """
 import json
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, List, Union
+import numpy as np
 import pandas as pd
 
+# Resolution pandas gives parsed date strings (ns before pandas 3, us since), so both load paths agree
+_DATE_DTYPE = pd.to_datetime(pd.Series(['2000-01-01'])).dtype
+
 
 def load_json(source_path: Union[str, Path]) -> pd.DataFrame:
     """
@@ -26,16 +30,43 @@ def load_json(source_path: Union[str, Path]) -> pd.DataFrame:
     with open(source_path, 'r') as f:
         data = json.load(f)
 
+    qqq_records = data['qqq']
+    qld_records = data['qld']
+
+    # Fast path: both series share the same dates (the common case), so parse them
+    # once and build the frame directly, skipping the second parse and the join
+    try:
+        dates = _parse_dates(qqq_records)
+        same_dates = (
+            len(qqq_records) == len(qld_records)
+            and np.array_equal(dates, _parse_dates(qld_records))
+        )
+    except ValueError:
+        # Dates not in plain YYYY-MM-DD form: let pandas parse them below
+        same_dates = False
+
+    if same_dates:
+        combined = pd.DataFrame(
+            {
+                'QQQ': _parse_prices(qqq_records),
+                'QLD': _parse_prices(qld_records),
+            },
+            index=pd.DatetimeIndex(dates.astype(_DATE_DTYPE), name='date'),
+        )
+        return combined if combined.index.is_monotonic_increasing else combined.sort_index()
+
     # Parse QQQ data
-    qqq_df = pd.DataFrame(data['qqq'])
+    qqq_df = pd.DataFrame(qqq_records)
     qqq_df['date'] = pd.to_datetime(qqq_df['date'])
     qqq_df = qqq_df.rename(columns={'adjClose': 'QQQ'})
+    qqq_df['QQQ'] = qqq_df['QQQ'].astype(np.float64)
     qqq_df = qqq_df.set_index('date')[['QQQ']]
 
     # Parse QLD data
-    qld_df = pd.DataFrame(data['qld'])
+    qld_df = pd.DataFrame(qld_records)
     qld_df['date'] = pd.to_datetime(qld_df['date'])
     qld_df = qld_df.rename(columns={'adjClose': 'QLD'})
+    qld_df['QLD'] = qld_df['QLD'].astype(np.float64)
     qld_df = qld_df.set_index('date')[['QLD']]
 
     # Inner join to ensure both have data on the same dates
@@ -45,3 +76,22 @@ def load_json(source_path: Union[str, Path]) -> pd.DataFrame:
     combined = combined.sort_index()
 
     return combined
+
+
+def _parse_dates(records: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Parse 'YYYY-MM-DD' record dates into a datetime64[D] array.
+
+    Raises:
+        ValueError: If any date is not a plain 'YYYY-MM-DD' string. NumPy would
+            otherwise accept times, timezones and 'YYYY-MM' and truncate them to the day.
+    """
+    raw_dates = [record['date'] for record in records]
+    if not all(isinstance(raw, str) and len(raw) == 10 for raw in raw_dates):
+        raise ValueError("Dates are not all plain YYYY-MM-DD strings")
+    return np.array(raw_dates, dtype='datetime64[D]')
+
+
+def _parse_prices(records: List[Dict[str, Any]]) -> np.ndarray:
+    """Extract adjClose prices as float64."""
+    return np.fromiter((record['adjClose'] for record in records), dtype=np.float64, count=len(records))
@@ -2,8 +2,10 @@
 Data repository - unified data access interface.
 Uses adapter pattern to support multiple data sources.
 """
+import numpy as np
 import pandas as pd
-from typing import Callable, Union
+from functools import lru_cache
+from typing import Callable, Optional, Union
 from pathlib import Path
 
 # Type alias for data loader functions
@@ -20,11 +22,34 @@ def load_data(source_func: DataLoaderFunc, source_path: Union[str, Path]) -> pd.
 
     Returns:
         Cleaned and standardized DataFrame
+
+    Results for local files are cached per (loader, path, modification time),
+    so Streamlit reruns skip parsing until the file changes.
     """
+    mtime_ns = _get_mtime_ns(source_path)
+    if mtime_ns is None:
+        # Not a local file (or missing): let the loader handle/raise, uncached
+        return _standardize_data(source_func(source_path))
+
+    resolved_path = str(Path(source_path).resolve())
+    return _load_standardized(source_func, resolved_path, mtime_ns).copy()
+
+
+@lru_cache(maxsize=8)
+def _load_standardized(source_func: DataLoaderFunc, source_path: str, mtime_ns: int) -> pd.DataFrame:
+    """Load and standardize data; mtime_ns only keys the cache."""
     df = source_func(source_path)
     return _standardize_data(df)
 
 
+def _get_mtime_ns(source_path: Union[str, Path]) -> Optional[int]:
+    """Modification time of a local file, or None if it cannot be stat'ed."""
+    try:
+        return Path(source_path).stat().st_mtime_ns
+    except (OSError, ValueError):
+        return None
+
+
 def _standardize_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardize loaded data.
@@ -40,9 +65,9 @@ def _standardize_data(df: pd.DataFrame) -> pd.DataFrame:
     # Forward fill any missing values
     df = df.ffill()
 
-    # Ensure numeric columns
-    for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+    # Ensure numeric columns (loaders that already emit float64 skip the coercion)
+    if not df.dtypes.eq(np.float64).all():
+        df = df.apply(pd.to_numeric, errors='coerce')
 
     # Drop any rows with NaN after conversion
     df = df.dropna()
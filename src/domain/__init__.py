@@ -1,12 +1,22 @@
-from .models import AssetConfig, PortfolioState, SimulationResult
-from .finance_math import calculate_cagr, calculate_max_drawdown, calculate_irr, calculate_sharpe_ratio
+from .models import AssetConfig, PortfolioState, SimulationResult, IDX_QQQ, IDX_QLD, TICKERS
+from .finance_math import (
+    calculate_cagr,
+    calculate_max_drawdown,
+    calculate_irr,
+    calculate_sharpe_ratio,
+    calculate_total_value,
+)
 
 __all__ = [
     'AssetConfig',
     'PortfolioState',
     'SimulationResult',
+    'IDX_QQQ',
+    'IDX_QLD',
+    'TICKERS',
     'calculate_cagr',
     'calculate_max_drawdown',
     'calculate_irr',
     'calculate_sharpe_ratio',
+    'calculate_total_value',
 ]
@@ -0,0 +1,136 @@
+"""
+Numba kernels behind finance_math.py.
+- summarize: fused single pass producing the same results as calculate_max_drawdown,
+  calculate_monthly_returns and calculate_volatility, without the intermediate lists
+- irr_newton: Newton-Raphson solver used by calculate_irr
+
+These are also the sources for the ahead-of-time build in scripts/compile_aot.py.
+"""
+from typing import Tuple
+import math
+import numpy as np
+
+from src.jit import njit
+
+
+@njit(cache=True, nogil=True)
+def summarize(values: np.ndarray) -> Tuple[float, float, np.ndarray]:
+    """
+    Compute max drawdown, volatility and monthly returns in one pass.
+
+    Args:
+        values: Portfolio values over time (float64)
+
+    Returns:
+        Tuple of (max drawdown %, annualized volatility %, monthly returns %)
+    """
+    n = len(values)
+    returns = np.empty(max(n - 1, 0), dtype=np.float64)
+
+    if n < 2:
+        return 0.0, 0.0, returns
+
+    max_drawdown = 0.0
+    peak = values[0]
+
+    # Welford running mean / sum of squared deviations of the returns
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+
+    for i in range(n):
+        value = values[i]
+
+        if value > peak:
+            peak = value
+        if peak > 0:
+            drawdown = (value - peak) / peak * 100
+            if drawdown < max_drawdown:
+                max_drawdown = drawdown
+
+        if i > 0 and values[i - 1] > 0:
+            ret = (value / values[i - 1] - 1) * 100
+            returns[count] = ret
+            count += 1
+            delta = ret - mean
+            mean += delta / count
+            m2 += delta * (ret - mean)
+
+    volatility = 0.0
+    if count >= 2:
+        # Annualize: multiply by sqrt(12) for monthly data
+        volatility = math.sqrt(m2 / (count - 1)) * math.sqrt(12)
+
+    return max_drawdown, volatility, returns[:count]
+
+
+@njit(cache=True, nogil=True)
+def irr_newton(
+    years: np.ndarray,
+    amounts: np.ndarray,
+    max_iterations: int,
+    tolerance: float,
+) -> float:
+    """
+    Newton-Raphson IRR solver over (years, amount) flow arrays.
+
+    Returns:
+        Annual IRR as a fraction (e.g., 0.125 for 12.5%)
+    """
+    n = len(years)
+
+    # Initial guess based on simple return
+    total_invested = 0.0
+    total_returned = 0.0
+    for i in range(n):
+        if amounts[i] < 0:
+            total_invested -= amounts[i]
+        elif amounts[i] > 0:
+            total_returned += amounts[i]
+
+    if total_invested <= 0:
+        return 0.0
+
+    years_span = years[n - 1]
+    if years_span <= 0:
+        years_span = 1.0
+
+    # Initial guess
+    simple_return = (total_returned / total_invested) - 1
+    rate = (1 + simple_return) ** (1 / years_span) - 1 if simple_return > -1 else 0.1
+
+    # Newton-Raphson iteration
+    for _ in range(max_iterations):
+        # NPV and its derivative with respect to rate
+        if rate <= -1:
+            npv_val = np.inf
+            derivative = np.inf
+        else:
+            # (1 + rate)^-years as one exp over the array, log1p taken once
+            discounted = amounts * np.exp(-years * math.log1p(rate))
+            npv_val = discounted.sum()
+            derivative = -(years * discounted).sum() / (1 + rate)
+
+        if abs(npv_val) < tolerance:
+            return rate
+
+        if abs(derivative) < 1e-10:
+            # Derivative too small, try bisection step
+            rate = rate * 0.5 if npv_val > 0 else rate * 1.5
+            continue
+
+        new_rate = rate - npv_val / derivative
+
+        # Prevent extreme jumps
+        if new_rate < -0.99:
+            new_rate = -0.99
+        elif new_rate > 10:
+            new_rate = 10.0
+
+        if abs(new_rate - rate) < tolerance:
+            return new_rate
+
+        rate = new_rate
+
+    # If didn't converge, return best estimate
+    return rate
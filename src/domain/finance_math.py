@@ -4,7 +4,18 @@ Implements CAGR, IRR (Newton-Raphson), Max Drawdown, and Sharpe Ratio.
 """
 from typing import List, Tuple
 from datetime import date
+from pathlib import Path
 import math
+import numpy as np
+
+from src.jit import load_aot
+
+# Ahead-of-time build produced by `python scripts/compile_aot.py`, if current
+_aot = load_aot('src.domain._aot_metrics', Path(__file__).with_name('_fast_metrics.py'))
+if _aot is not None:
+    irr_newton, summarize = _aot.irr_newton, _aot.summarize
+else:
+    from ._fast_metrics import irr_newton, summarize
 
 
 def calculate_cagr(start_value: float, end_value: float, years: float) -> float:
@@ -24,10 +35,43 @@ def calculate_cagr(start_value: float, end_value: float, years: float) -> float:
     if end_value <= 0:
         return -100.0
 
-    cagr = (pow(end_value / start_value, 1 / years) - 1) * 100
+    # expm1(log(x) / years) == x^(1/years) - 1, without cancellation for small returns
+    cagr = math.expm1(math.log(end_value / start_value) / years) * 100
     return cagr
 
 
+def calculate_total_value(shares: np.ndarray, cash: float, prices: np.ndarray) -> float:
+    """
+    Calculate total portfolio value.
+
+    Args:
+        shares: Share counts [QQQ, QLD]
+        cash: Cash balance
+        prices: Prices aligned with shares
+
+    Returns:
+        Value of the holdings plus cash
+    """
+    # Unrolled over the two slots: cheaper than a matmul call on 2-element arrays,
+    # and the same arithmetic as the vectorized kernels
+    qqq_shares, qld_shares = shares.tolist()
+    qqq_price, qld_price = prices.tolist()
+    return qqq_shares * qqq_price + qld_shares * qld_price + cash
+
+
+def calculate_monthly_rate(annual_yield: float) -> float:
+    """
+    Convert an annual yield to the equivalent monthly compounding rate.
+
+    Args:
+        annual_yield: Annual yield as a percentage (e.g., 4.0 for 4%)
+
+    Returns:
+        Monthly rate as a fraction: (1 + annual_yield/100)^(1/12) - 1
+    """
+    return math.expm1(math.log1p(annual_yield / 100) / 12)
+
+
 def calculate_max_drawdown(history_values: List[float]) -> float:
     """
     Calculate Maximum Drawdown from a series of portfolio values.
@@ -58,7 +102,8 @@ def calculate_max_drawdown(history_values: List[float]) -> float:
 def calculate_irr(
     cash_flows: List[Tuple[date, float]],
     max_iterations: int = 100,
-    tolerance: float = 1e-7
+    tolerance: float = 1e-7,
+    presorted: bool = False,
 ) -> float:
     """
     Calculate Internal Rate of Return using Newton-Raphson method.
@@ -71,6 +116,7 @@ def calculate_irr(
         cash_flows: List of (date, amount) tuples
         max_iterations: Maximum iterations for convergence
         tolerance: Convergence threshold
+        presorted: Caller guarantees cash_flows are already in date order (skips the sort)
 
     Returns:
         Annual IRR as a percentage (e.g., 12.5 for 12.5%)
@@ -82,78 +128,17 @@ def calculate_irr(
         return 0.0
 
     # Sort by date
-    sorted_flows = sorted(cash_flows, key=lambda x: x[0])
+    if presorted:
+        sorted_flows = cash_flows
+    else:
+        sorted_flows = sorted(cash_flows, key=lambda x: x[0])
     base_date = sorted_flows[0][0]
 
     # Convert dates to years from base date
-    flows_with_years: List[Tuple[float, float]] = []
-    for dt, amount in sorted_flows:
-        years = (dt - base_date).days / 365.25
-        flows_with_years.append((years, amount))
-
-    def npv(rate: float) -> float:
-        """Calculate NPV at given rate."""
-        if rate <= -1:
-            return float('inf')
-        total = 0.0
-        for years, amount in flows_with_years:
-            total += amount / pow(1 + rate, years)
-        return total
-
-    def npv_derivative(rate: float) -> float:
-        """Calculate derivative of NPV with respect to rate."""
-        if rate <= -1:
-            return float('inf')
-        total = 0.0
-        for years, amount in flows_with_years:
-            if years != 0:
-                total -= years * amount / pow(1 + rate, years + 1)
-        return total
-
-    # Initial guess based on simple return
-    total_invested = sum(-amt for _, amt in flows_with_years if amt < 0)
-    total_returned = sum(amt for _, amt in flows_with_years if amt > 0)
-
-    if total_invested <= 0:
-        return 0.0
-
-    years_span = flows_with_years[-1][0] if flows_with_years else 1
-    if years_span <= 0:
-        years_span = 1
-
-    # Initial guess
-    simple_return = (total_returned / total_invested) - 1
-    rate = pow(1 + simple_return, 1 / years_span) - 1 if simple_return > -1 else 0.1
-
-    # Newton-Raphson iteration
-    for _ in range(max_iterations):
-        npv_val = npv(rate)
-
-        if abs(npv_val) < tolerance:
-            return rate * 100  # Convert to percentage
-
-        derivative = npv_derivative(rate)
-
-        if abs(derivative) < 1e-10:
-            # Derivative too small, try bisection step
-            rate = rate * 0.5 if npv_val > 0 else rate * 1.5
-            continue
-
-        new_rate = rate - npv_val / derivative
-
-        # Prevent extreme jumps
-        if new_rate < -0.99:
-            new_rate = -0.99
-        elif new_rate > 10:
-            new_rate = 10
-
-        if abs(new_rate - rate) < tolerance:
-            return new_rate * 100
-
-        rate = new_rate
+    years = np.array([(dt - base_date).days / 365.25 for dt, _ in sorted_flows], dtype=np.float64)
+    amounts = np.array([amount for _, amount in sorted_flows], dtype=np.float64)
 
-    # If didn't converge, return best estimate with warning
-    return rate * 100
+    return irr_newton(years, amounts, max_iterations, tolerance) * 100  # Convert to percentage
 
 
 def calculate_volatility(monthly_returns: List[float]) -> float:
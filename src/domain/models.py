@@ -4,7 +4,17 @@ All classes are immutable (frozen=True) following FP principles.
 """
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Sequence
+import numpy as np
+
+# Fixed slots of the share/price arrays
+IDX_QQQ = 0
+IDX_QLD = 1
+TICKERS = ('QQQ', 'QLD')
+
+# Shared read-only default so states of memoryless strategies don't each allocate a dict
+_EMPTY_MEMORY: Mapping[str, Any] = MappingProxyType({})
 
 
 @dataclass(frozen=True)
@@ -14,25 +24,39 @@ class AssetConfig:
     qld_weight: float  # QLD allocation percentage (0-100)
     cash_weight: float  # Cash allocation percentage (0-100)
     cash_yield_annual: float  # Annual yield for cash/MMF (e.g., 4.0 for 4%)
+    # Derived allocation fractions (e.g., 0.4 for 40%): floats for scalar math...
+    qqq_fraction: float = field(init=False, repr=False, compare=False)
+    qld_fraction: float = field(init=False, repr=False, compare=False)
+    cash_fraction: float = field(init=False, repr=False, compare=False)
+    # ...and the stock fractions as a read-only array aligned with the share/price arrays [QQQ, QLD]
+    stock_weights: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         total = self.qqq_weight + self.qld_weight + self.cash_weight
         if abs(total - 100.0) > 0.01:
             raise ValueError(f"Asset weights must sum to 100%, got {total}%")
 
+        object.__setattr__(self, 'qqq_fraction', self.qqq_weight / 100)
+        object.__setattr__(self, 'qld_fraction', self.qld_weight / 100)
+        object.__setattr__(self, 'cash_fraction', self.cash_weight / 100)
 
-@dataclass(frozen=True)
+        stock_weights = np.array([self.qqq_fraction, self.qld_fraction])
+        stock_weights.setflags(write=False)
+        object.__setattr__(self, 'stock_weights', stock_weights)
+
+
+@dataclass(frozen=True, slots=True)
 class PortfolioState:
     """
     Represents the portfolio state at a single point in time.
     Immutable to prevent accidental modification of historical data.
     """
     date: date
-    shares: Dict[str, float]  # {'QQQ': 10.5, 'QLD': 20.0}
+    shares: np.ndarray  # [QQQ shares, QLD shares], indexed by IDX_QQQ / IDX_QLD
     cash_balance: float
     total_value: float
     # For strategies that need to remember state across time steps (e.g., Strategy 4)
-    strategy_memory: Dict[str, Any] = field(default_factory=dict)
+    strategy_memory: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MEMORY)
 
     def with_updates(self, **kwargs) -> 'PortfolioState':
         """Create a new state with updated fields (immutable update pattern)."""
@@ -44,11 +68,43 @@ class PortfolioState:
             strategy_memory=kwargs.get('strategy_memory', self.strategy_memory),
         )
 
+    @property
+    def shares_dict(self) -> Dict[str, float]:
+        """Shares keyed by ticker, e.g. {'QQQ': 10.5, 'QLD': 20.0}."""
+        return dict(zip(TICKERS, self.shares.tolist()))
+
 
 @dataclass(frozen=True)
 class SimulationResult:
     """Complete result of a backtest simulation."""
     strategy_name: str
-    history: List[PortfolioState]
+    history: Sequence[PortfolioState]  # List or lazily built view; supports len/index/iteration
     metrics: Dict[str, float]  # CAGR, IRR, MaxDrawdown, Sharpe, etc.
     total_invested: float  # Total capital invested over the simulation
+    # Per-entry series aligned with history, for charting (filled from history when omitted)
+    dates_np: Optional[np.ndarray] = field(default=None, repr=False, compare=False)  # datetime64[D]
+    values_np: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    cash_np: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    shares_np: Optional[np.ndarray] = field(default=None, repr=False, compare=False)  # (entries, 2)
+
+    def __post_init__(self):
+        if self.dates_np is None:
+            object.__setattr__(self, 'dates_np', np.array([s.date for s in self.history], dtype='datetime64[D]'))
+        if self.values_np is None:
+            object.__setattr__(self, 'values_np', np.array([s.total_value for s in self.history], dtype=np.float64))
+        if self.cash_np is None:
+            object.__setattr__(self, 'cash_np', np.array([s.cash_balance for s in self.history], dtype=np.float64))
+        if self.shares_np is None:
+            shares = np.array([s.shares for s in self.history], dtype=np.float64).reshape(-1, len(TICKERS))
+            object.__setattr__(self, 'shares_np', shares)
+
+    @property
+    def formatted_metrics(self) -> Dict[str, str]:
+        """Display strings for the headline metrics."""
+        metrics = self.metrics
+        return {
+            'final_balance': f"${metrics.get('final_balance', 0):,.0f}",
+            'irr': f"{metrics.get('irr', 0):.2f}%",
+            'cagr': f"{metrics.get('cagr', 0):.2f}%",
+            'max_drawdown': f"{metrics.get('max_drawdown', 0):.1f}%",
+        }
@@ -0,0 +1,63 @@
+"""
+Optional Numba JIT support.
+Numeric kernels are decorated with `njit`; without Numba installed they run as plain Python.
+Prebuilt ahead-of-time modules (scripts/compile_aot.py) are loaded through `load_aot`.
+"""
+from pathlib import Path
+from types import ModuleType
+from typing import Optional, Union
+import hashlib
+import importlib
+import warnings
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on environment
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable bare or with options."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+def source_stamp(source_path: Union[str, Path]) -> int:
+    """64-bit hash of a kernel source file, recorded in its AOT build."""
+    digest = hashlib.sha256(Path(source_path).read_bytes()).digest()
+    return int.from_bytes(digest[:8], 'little', signed=True)
+
+
+def load_aot(module_name: str, source_path: Union[str, Path]) -> Optional[ModuleType]:
+    """
+    Import a prebuilt AOT module, but only if it was built from the current kernel source.
+
+    Args:
+        module_name: Absolute name of the extension module
+        source_path: Kernel source file the module was compiled from
+
+    Returns:
+        The module, or None when it is missing or stale (the caller then uses the njit kernels)
+    """
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+    built_stamp = getattr(module, 'source_stamp', None)
+    if built_stamp is None or built_stamp() != source_stamp(source_path):
+        warnings.warn(
+            f"{module_name} is out of date with {Path(source_path).name}; using the JIT kernels. "
+            "Rebuild with `python scripts/compile_aot.py`.",
+            stacklevel=2,
+        )
+        return None
+
+    return module
+
+
+__all__ = ['njit', 'HAS_NUMBA', 'source_stamp', 'load_aot']
@@ -1,3 +1,10 @@
-from .engine import run_backtest
+from .engine import run_backtest, BacktestError, BacktestConfigError, BacktestDataError
+from .vectorized import run_backtest_vectorized
 
-__all__ = ['run_backtest']
+__all__ = [
+    'run_backtest',
+    'run_backtest_vectorized',
+    'BacktestError',
+    'BacktestConfigError',
+    'BacktestDataError',
+]
@@ -0,0 +1,91 @@
+"""
+Numba kernels behind vectorized.py.
+- smart_adjust_path: the Smart Adjust monthly loop over scalar holdings
+
+These are also the sources for the ahead-of-time build in scripts/compile_aot.py.
+"""
+import numpy as np
+
+from src.jit import njit
+
+
+@njit(cache=True, nogil=True)
+def smart_adjust_path(
+    prices_qqq: np.ndarray,
+    prices_qld: np.ndarray,
+    months: np.ndarray,
+    years: np.ndarray,
+    qqq_amount: float,
+    qld_amount: float,
+    cash_amount: float,
+    growth_factor: float,
+    init_qqq: float,
+    init_qld: float,
+    init_cash: float,
+    qqq_shares: np.ndarray,
+    qld_shares: np.ndarray,
+    cash: np.ndarray,
+) -> None:
+    """
+    Monthly Smart Adjust loop over scalar holdings; fills qqq_shares, qld_shares and cash.
+
+    Mirrors strategy_smart_adjust: QLD profit for the year is measured against the
+    QLD value in the first month of the calendar year plus the QLD bought since.
+    """
+    qqq = init_qqq
+    qld = init_qld
+    balance = init_cash
+
+    # Year tracking carried across months (strategy_memory in the strategy function)
+    start_year_qld_value = 0.0
+    year_qld_inflows = 0.0
+    last_year = -1
+
+    for i in range(len(prices_qqq)):
+        qqq_price = prices_qqq[i]
+        qld_price = prices_qld[i]
+
+        # Cash interest (before any transactions)
+        if i > 0:
+            balance *= growth_factor
+
+        # Handle year transition - reset tracking
+        if years[i] != last_year:
+            start_year_qld_value = qld * qld_price
+            year_qld_inflows = 0.0
+            last_year = years[i]
+
+        # DCA (amounts are 0 when there is no contribution)
+        if i > 0:
+            if qqq_price > 0:
+                qqq += qqq_amount / qqq_price
+            if qld_price > 0:
+                qld += qld_amount / qld_price
+                year_qld_inflows += qld_amount
+            balance += cash_amount
+
+        # Smart adjust at year end (December)
+        if months[i] == 12 and i > 0:
+            qld_profit = qld * qld_price - (start_year_qld_value + year_qld_inflows)
+
+            if qld_profit > 0:
+                # Profit: Sell 1/3 of profit, move to Cash
+                profit_to_take = qld_profit / 3
+                if qld_price > 0 and profit_to_take > 0:
+                    shares_to_sell = min(profit_to_take / qld_price, qld)
+                    qld -= shares_to_sell
+                    balance += shares_to_sell * qld_price
+            else:
+                # Loss or flat: Buy QLD worth 2% of total portfolio using Cash
+                total_value = qqq * qqq_price + qld * qld_price + balance
+                buy_amount = min(total_value * 0.02, balance)
+                if buy_amount > 0 and qld_price > 0:
+                    qld += buy_amount / qld_price
+                    balance -= buy_amount
+
+        # Ensure cash never goes negative
+        balance = max(0.0, balance)
+
+        qqq_shares[i] = qqq
+        qld_shares[i] = qld
+        cash[i] = balance
@@ -2,26 +2,126 @@
 Backtest simulation engine.
 Stateless loop that iterates through time, applies interest, and calls strategy functions.
 """
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date
-from typing import Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+import operator
+import numpy as np
 import pandas as pd
 
-from src.domain.models import AssetConfig, PortfolioState, SimulationResult
+from src.domain.models import AssetConfig, PortfolioState, SimulationResult, IDX_QQQ, IDX_QLD, TICKERS
 from src.domain.finance_math import (
     calculate_cagr,
-    calculate_max_drawdown,
     calculate_irr,
+    calculate_monthly_rate,
     calculate_sharpe_ratio,
-    calculate_volatility,
-    calculate_monthly_returns,
+    calculate_total_value,
+    summarize,
 )
+from src.strategies.core_logic import (
+    strategy_lump_sum,
+    strategy_dca_monthly,
+    strategy_dca_yearly_rebalance,
+)
+from src.strategies.special_rules import strategy_smart_adjust
+from .vectorized import run_backtest_vectorized
+
+
+class BacktestError(ValueError):
+    """Base class for errors that make a backtest impossible to run."""
+
+
+class BacktestConfigError(BacktestError):
+    """Invalid simulation parameters (capital, contribution)."""
+
+
+class BacktestDataError(BacktestError):
+    """Market data unusable for simulation (empty, missing columns, unsorted dates, bad prices)."""
+
 
 # Strategy function type signature
 StrategyFunc = Callable[
-    [PortfolioState, Dict[str, float], AssetConfig, float, bool],
+    [PortfolioState, np.ndarray, AssetConfig, float, bool],
     PortfolioState
 ]
 
+# Built-in strategies with a whole-timeline kernel in vectorized.py (closed-form NumPy or a compiled loop)
+_VECTORIZED_STRATEGIES: Dict[StrategyFunc, str] = {
+    strategy_lump_sum: 'lump_sum',
+    strategy_dca_monthly: 'dca_monthly',
+    strategy_dca_yearly_rebalance: 'dca_yearly_rebalance',
+    strategy_smart_adjust: 'smart_adjust',
+}
+
+
+@dataclass
+class _MutableState:
+    """
+    Working portfolio state mutated in place inside the monthly loop.
+    Only snapshotted to an immutable PortfolioState at the strategy boundary.
+    """
+    date: date
+    shares: np.ndarray
+    cash_balance: float
+    total_value: float
+    strategy_memory: Mapping[str, Any]
+
+    @classmethod
+    def from_state(cls, state: PortfolioState) -> '_MutableState':
+        """Start a working state from an immutable one."""
+        return cls(state.date, state.shares, state.cash_balance, state.total_value, state.strategy_memory)
+
+    def load(self, state: PortfolioState) -> None:
+        """Take over holdings and memory from a strategy result."""
+        self.shares = state.shares
+        self.cash_balance = state.cash_balance
+        self.strategy_memory = state.strategy_memory
+
+    def snapshot(self) -> PortfolioState:
+        """Freeze the current working values into a PortfolioState."""
+        return PortfolioState(
+            date=self.date,
+            shares=self.shares,
+            cash_balance=self.cash_balance,
+            total_value=self.total_value,
+            strategy_memory=self.strategy_memory,
+        )
+
+
+class _LazyHistory(Sequence):
+    """
+    Read-only PortfolioState sequence backed by per-month arrays.
+    States are only built when accessed, so unread history costs no allocations.
+    """
+    __slots__ = ('_dates', '_shares', '_cash', '_values')
+
+    def __init__(self, dates: List[date], shares: np.ndarray, cash: np.ndarray, values: np.ndarray):
+        self._dates = dates
+        self._shares = shares
+        self._cash = cash
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        i = operator.index(index)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("history index out of range")
+
+        return PortfolioState(
+            date=self._dates[i],
+            shares=self._shares[i],
+            cash_balance=float(self._cash[i]),
+            total_value=float(self._values[i]),
+        )
+
 
 def run_backtest(
     market_df: pd.DataFrame,
@@ -44,158 +144,257 @@ def run_backtest(
 
     Returns:
         SimulationResult with history and metrics
-    """
-    history: List[PortfolioState] = []
-    cash_flows: List[Tuple[date, float]] = []
 
-    # Initialize state
-    first_date = market_df.index[0].date()
-    first_prices = {
-        'QQQ': float(market_df.iloc[0]['QQQ']),
-        'QLD': float(market_df.iloc[0]['QLD']),
-    }
+    Raises:
+        BacktestConfigError: If capital or contribution is negative or not finite
+        BacktestDataError: If market_df is empty, lacks price columns or has non-finite prices
+    """
+    _validate_inputs(market_df, initial_capital, monthly_contribution)
+
+    # Extract dates and prices once; price rows follow the IDX_QQQ / IDX_QLD layout
+    dates = [dt.date() for dt in market_df.index.to_pydatetime()]
+    prices = market_df[list(TICKERS)].to_numpy(dtype=np.float64)
+    prices.setflags(write=False)
+
+    if not np.isfinite(prices).all():
+        raise BacktestDataError("Price data contains missing or non-finite values")
+
+    strategy_id = _VECTORIZED_STRATEGIES.get(strategy_func)
+    if strategy_id is not None:
+        path = run_backtest_vectorized(
+            prices[:, IDX_QQQ],
+            prices[:, IDX_QLD],
+            config,
+            initial_capital,
+            monthly_contribution,
+            strategy_id,
+            months=market_df.index.month.to_numpy(),
+            years=market_df.index.year.to_numpy(),
+        )
+        history, history_values, history_cash, history_shares = _history_from_arrays(dates, *path)
+    else:
+        history, history_values, history_cash, history_shares = _simulate_monthly(
+            dates, prices, strategy_func, config, initial_capital, monthly_contribution
+        )
 
-    state = _initialize_state(first_date, initial_capital, config, first_prices)
-    history.append(state)
+    cash_flows: List[Tuple[date, float]] = []
 
     # Record initial investment as negative cash flow
-    cash_flows.append((first_date, -initial_capital))
+    cash_flows.append((dates[0], -initial_capital))
 
     total_invested = initial_capital
 
+    # Record monthly contributions as cash flows (except first month - already counted in initial)
+    # For Lump Sum strategy, monthly contribution is not used
+    if monthly_contribution > 0 and strategy_name != "Lump Sum":
+        for current_date in dates[1:]:
+            cash_flows.append((current_date, -monthly_contribution))
+            total_invested += monthly_contribution
+
+    # Final cash flow: ending value as positive
+    final_date = dates[-1]
+    final_value = float(history_values[-1])
+    cash_flows.append((final_date, final_value))
+
+    # Calculate metrics
+    metrics = _calculate_metrics(
+        dates[0], final_date, history_values, cash_flows, config.cash_yield_annual, total_invested
+    )
+
+    return SimulationResult(
+        strategy_name=strategy_name,
+        history=history,
+        metrics=metrics,
+        total_invested=total_invested,
+        dates_np=_history_dates(market_df.index),
+        values_np=history_values,
+        cash_np=history_cash,
+        shares_np=history_shares,
+    )
+
+
+def _validate_inputs(market_df: pd.DataFrame, initial_capital: float, monthly_contribution: float) -> None:
+    """Reject parameters and data the simulation cannot handle."""
+    for label, amount in (("Initial capital", initial_capital), ("Monthly contribution", monthly_contribution)):
+        if not np.isfinite(amount) or amount < 0:
+            raise BacktestConfigError(f"{label} must be a non-negative number, got {amount}")
+
+    if market_df.empty:
+        raise BacktestDataError("Market data is empty")
+
+    missing = [ticker for ticker in TICKERS if ticker not in market_df.columns]
+    if missing:
+        raise BacktestDataError(f"Market data is missing price columns: {missing}")
+
+    if not isinstance(market_df.index, pd.DatetimeIndex):
+        raise BacktestDataError("Market data must be indexed by date (DatetimeIndex)")
+
+    # Cash flows are built in index order and handed to calculate_irr as presorted
+    if not market_df.index.is_monotonic_increasing:
+        raise BacktestDataError("Market data must be sorted by date in ascending order")
+
+
+def _simulate_monthly(
+    dates: List[date],
+    prices: np.ndarray,
+    strategy_func: StrategyFunc,
+    config: AssetConfig,
+    initial_capital: float,
+    monthly_contribution: float,
+) -> Tuple[List[PortfolioState], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Generic month-by-month loop for strategies without a vectorized kernel.
+
+    Args:
+        dates: Date of each month
+        prices: Price matrix of shape (months, 2); each row is passed to the strategy
+
+    Returns:
+        Tuple of (history, total value, cash and shares per history entry); history[0] is the initial state
+    """
+    n = len(dates)
+    history: List[Optional[PortfolioState]] = [None] * (n + 1)
+    history_values = np.empty(n + 1, dtype=np.float64)
+    history_cash = np.empty(n + 1, dtype=np.float64)
+    history_shares = np.empty((n + 1, 2), dtype=np.float64)
+
+    # Initialize state
+    state = _initialize_state(dates[0], initial_capital, config, prices[0])
+    history[0] = state
+    history_values[0] = state.total_value
+    history_cash[0] = state.cash_balance
+    history_shares[0] = state.shares
+
+    work = _MutableState.from_state(state)
+
+    # Loop invariants
+    growth_factor = 1.0 + calculate_monthly_rate(config.cash_yield_annual)
+
     # Iterate through each month
-    for i, (timestamp, row) in enumerate(market_df.iterrows()):
-        current_date = timestamp.date()
-        prices = {
-            'QQQ': float(row['QQQ']),
-            'QLD': float(row['QLD']),
-        }
+    for i in range(n):
+        current_date = dates[i]
+        month_prices = prices[i]
 
         is_first_month = (i == 0)
+        work.date = current_date
 
         # Step 1: Apply cash interest (before any transactions)
         if not is_first_month:
-            state = _apply_interest(state, config.cash_yield_annual, current_date)
+            _apply_interest(work, growth_factor)
 
         # Step 2: Apply strategy
         # For first month, we already initialized, so only apply strategy for subsequent months
         # But strategy might need to run on first month for some logic
-        state = strategy_func(state, prices, config, monthly_contribution, is_first_month)
-
-        # Record monthly contribution as cash flow (except first month - already counted in initial)
-        if not is_first_month and monthly_contribution > 0:
-            # Check if strategy actually used the contribution
-            # For Lump Sum strategy, monthly contribution is 0
-            if strategy_name != "Lump Sum":
-                cash_flows.append((current_date, -monthly_contribution))
-                total_invested += monthly_contribution
+        state = strategy_func(work.snapshot(), month_prices, config, monthly_contribution, is_first_month)
+        work.load(state)
 
         # Update total value based on current prices
-        total_value = _calculate_total_value(state.shares, state.cash_balance, prices)
-        state = state.with_updates(date=current_date, total_value=total_value)
+        work.total_value = calculate_total_value(work.shares, work.cash_balance, month_prices)
 
-        history.append(state)
+        # Reuse the strategy's result when it already agrees with the engine
+        if state.date != work.date or state.total_value != work.total_value:
+            state = work.snapshot()
 
-    # Final cash flow: ending value as positive
-    final_date = history[-1].date
-    final_value = history[-1].total_value
-    cash_flows.append((final_date, final_value))
+        history[i + 1] = state
+        history_values[i + 1] = work.total_value
+        history_cash[i + 1] = work.cash_balance
+        history_shares[i + 1] = work.shares
 
-    # Calculate metrics
-    metrics = _calculate_metrics(history, cash_flows, config.cash_yield_annual, total_invested)
+    return history, history_values, history_cash, history_shares
 
-    return SimulationResult(
-        strategy_name=strategy_name,
-        history=history,
-        metrics=metrics,
-        total_invested=total_invested,
-    )
+
+def _history_from_arrays(
+    dates: List[date],
+    qqq_shares: np.ndarray,
+    qld_shares: np.ndarray,
+    cash: np.ndarray,
+    total_value: np.ndarray,
+) -> Tuple[_LazyHistory, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lay per-month arrays out as history entries for the UI.
+
+    Returns:
+        Tuple of (lazy history, total value, cash and shares per history entry)
+    """
+    # The initial state and the first month share the same date and holdings
+    order = np.concatenate(([0], np.arange(len(dates))))
+    history_dates = [dates[0]] + dates
+    history_values = total_value[order]
+
+    # One row per entry; each state holds a view of its row
+    shares = np.column_stack((qqq_shares, qld_shares))[order]
+    shares.setflags(write=False)
+
+    history_cash = cash[order]
+    history = _LazyHistory(history_dates, shares, history_cash, history_values)
+    return history, history_values, history_cash, shares
+
+
+def _history_dates(index: pd.DatetimeIndex) -> np.ndarray:
+    """Dates of each history entry as datetime64[D]; the initial state repeats the first month."""
+    month_dates = index.to_numpy().astype('datetime64[D]')
+    return np.concatenate((month_dates[:1], month_dates))
 
 
 def _initialize_state(
     init_date: date,
     capital: float,
     config: AssetConfig,
-    prices: Dict[str, float]
+    prices: np.ndarray
 ) -> PortfolioState:
     """Initialize portfolio state based on asset allocation."""
-    qqq_allocation = capital * (config.qqq_weight / 100)
-    qld_allocation = capital * (config.qld_weight / 100)
-    cash_allocation = capital * (config.cash_weight / 100)
+    stock_allocations = capital * config.stock_weights
+    cash_allocation = capital * config.cash_fraction
 
-    shares = {
-        'QQQ': qqq_allocation / prices['QQQ'] if prices['QQQ'] > 0 else 0,
-        'QLD': qld_allocation / prices['QLD'] if prices['QLD'] > 0 else 0,
-    }
+    shares = np.divide(stock_allocations, prices, out=np.zeros(2), where=prices > 0)
 
-    total_value = _calculate_total_value(shares, cash_allocation, prices)
+    total_value = calculate_total_value(shares, cash_allocation, prices)
 
     return PortfolioState(
         date=init_date,
         shares=shares,
         cash_balance=cash_allocation,
         total_value=total_value,
-        strategy_memory={},
     )
 
 
 def _apply_interest(
-    state: PortfolioState,
-    annual_yield: float,
-    current_date: date
-) -> PortfolioState:
-    """Apply monthly interest to cash balance."""
-    # Monthly rate from annual yield: (1 + annual_yield/100)^(1/12) - 1
-    monthly_rate = pow(1 + annual_yield / 100, 1 / 12) - 1
-    new_cash = state.cash_balance * (1 + monthly_rate)
-
-    return state.with_updates(cash_balance=new_cash, date=current_date)
-
-
-def _calculate_total_value(
-    shares: Dict[str, float],
-    cash: float,
-    prices: Dict[str, float]
-) -> float:
-    """Calculate total portfolio value."""
-    stock_value = sum(
-        shares.get(ticker, 0) * prices.get(ticker, 0)
-        for ticker in ['QQQ', 'QLD']
-    )
-    return stock_value + cash
+    work: _MutableState,
+    growth_factor: float,
+) -> None:
+    """Apply monthly interest (growth_factor = 1 + monthly rate) to cash balance in place."""
+    work.cash_balance *= growth_factor
 
 
 def _calculate_metrics(
-    history: List[PortfolioState],
+    start_date: date,
+    end_date: date,
+    values: np.ndarray,
     cash_flows: List[Tuple[date, float]],
     risk_free_rate: float,
     total_invested: float,
 ) -> Dict[str, float]:
-    """Calculate all performance metrics."""
-    if len(history) < 2:
+    """Calculate all performance metrics from the per-entry total values."""
+    if len(values) < 2:
         return {}
 
-    values = [s.total_value for s in history]
-    start_value = values[0]
-    end_value = values[-1]
+    start_value = float(values[0])
+    end_value = float(values[-1])
 
     # Time span in years
-    start_date = history[0].date
-    end_date = history[-1].date
     years = (end_date - start_date).days / 365.25
 
     # CAGR
     cagr = calculate_cagr(start_value, end_value, years)
 
-    # Max Drawdown
-    max_dd = calculate_max_drawdown(values)
+    # Max Drawdown and Volatility in a single pass over the values
+    max_dd, volatility, _ = summarize(values)
 
     # IRR
-    irr = calculate_irr(cash_flows)
+    # Cash flows are appended in date order by run_backtest
+    irr = calculate_irr(cash_flows, presorted=True)
 
-    # Volatility and Sharpe
-    monthly_returns = calculate_monthly_returns(values)
-    volatility = calculate_volatility(monthly_returns)
+    # Sharpe
     sharpe = calculate_sharpe_ratio(cagr, risk_free_rate, volatility)
 
     return {
@@ -0,0 +1,281 @@
+"""
+Vectorized backtest kernels.
+Whole-timeline implementations of the built-in strategies: closed-form NumPy DCA
+between yearly events, or a single Numba-compiled monthly loop where each event
+depends on the path before it.
+"""
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+import math
+import numpy as np
+
+from src.domain.models import AssetConfig
+from src.domain.finance_math import calculate_monthly_rate
+from src.jit import load_aot
+
+# Ahead-of-time build produced by `python scripts/compile_aot.py`, if current
+_aot = load_aot('src.simulation._aot_kernels', Path(__file__).with_name('_kernels.py'))
+if _aot is not None:
+    smart_adjust_path = _aot.smart_adjust_path
+else:
+    from ._kernels import smart_adjust_path
+
+# (qqq_shares, qld_shares, cash, total_value), one entry per month
+PathArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def run_backtest_vectorized(
+    prices_qqq: np.ndarray,
+    prices_qld: np.ndarray,
+    config: AssetConfig,
+    initial_capital: float,
+    monthly_contribution: float,
+    strategy_id: str,
+    months: Optional[np.ndarray] = None,
+    years: Optional[np.ndarray] = None,
+) -> PathArrays:
+    """
+    Simulate a built-in strategy over the whole price history in one shot.
+
+    Month 0 holds the initial allocation; interest and contributions are
+    applied from month 1 onwards, matching the engine's monthly loop.
+
+    Args:
+        prices_qqq: QQQ price per month
+        prices_qld: QLD price per month
+        config: Asset allocation configuration
+        initial_capital: Starting capital
+        monthly_contribution: Monthly contribution amount
+        strategy_id: Kernel identifier (see VECTORIZED_STRATEGY_IDS)
+        months: Calendar month (1-12) per entry; required for calendar-driven kernels
+        years: Calendar year per entry; required for 'smart_adjust'
+
+    Returns:
+        Tuple of (qqq_shares, qld_shares, cash, total_value) arrays
+
+    Raises:
+        KeyError: If no kernel exists for strategy_id
+        ValueError: If the kernel needs months/years and they were not given
+    """
+    if strategy_id not in _KERNELS:
+        raise KeyError(f"No vectorized kernel for '{strategy_id}'. Available: {list(_KERNELS.keys())}")
+    if months is None and strategy_id in _NEEDS_MONTHS:
+        raise ValueError(f"Kernel '{strategy_id}' requires the months array")
+    if years is None and strategy_id in _NEEDS_YEARS:
+        raise ValueError(f"Kernel '{strategy_id}' requires the years array")
+
+    prices_qqq = np.asarray(prices_qqq, dtype=np.float64)
+    prices_qld = np.asarray(prices_qld, dtype=np.float64)
+    # Lists would make `months == 1` a scalar comparison, so normalize calendar inputs once
+    if months is not None:
+        months = np.asarray(months, dtype=np.int64)
+    if years is not None:
+        years = np.asarray(years, dtype=np.int64)
+
+    qqq_shares, qld_shares, cash = _KERNELS[strategy_id](
+        prices_qqq, prices_qld, config, initial_capital, monthly_contribution, months, years
+    )
+    total_value = qqq_shares * prices_qqq + qld_shares * prices_qld + cash
+
+    return qqq_shares, qld_shares, cash, total_value
+
+
+def _kernel_lump_sum(
+    prices_qqq: np.ndarray,
+    prices_qld: np.ndarray,
+    config: AssetConfig,
+    initial_capital: float,
+    monthly_contribution: float,
+    months: Optional[np.ndarray],
+    years: Optional[np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Lump Sum: initial shares held forever, cash compounds."""
+    n = len(prices_qqq)
+    init_qqq, init_qld, init_cash = _initial_allocation(prices_qqq, prices_qld, config, initial_capital)
+
+    qqq_shares = np.full(n, init_qqq)
+    qld_shares = np.full(n, init_qld)
+    cash = _compound_cash(n, init_cash, 0.0, config.cash_yield_annual)
+
+    return qqq_shares, qld_shares, cash
+
+
+def _kernel_dca_monthly(
+    prices_qqq: np.ndarray,
+    prices_qld: np.ndarray,
+    config: AssetConfig,
+    initial_capital: float,
+    monthly_contribution: float,
+    months: Optional[np.ndarray],
+    years: Optional[np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """DCA Monthly: buy by weight every month after the first, never sell."""
+    n = len(prices_qqq)
+    init_qqq, init_qld, init_cash = _initial_allocation(prices_qqq, prices_qld, config, initial_capital)
+    qqq_amount, qld_amount, cash_amount = _contribution_amounts(config, monthly_contribution)
+
+    qqq_shares = np.cumsum(np.concatenate(([init_qqq], _shares_bought(qqq_amount, prices_qqq[1:]))))
+    qld_shares = np.cumsum(np.concatenate(([init_qld], _shares_bought(qld_amount, prices_qld[1:]))))
+    cash = _compound_cash(n, init_cash, cash_amount, config.cash_yield_annual)
+
+    return qqq_shares, qld_shares, cash
+
+
+def _kernel_dca_yearly_rebalance(
+    prices_qqq: np.ndarray,
+    prices_qld: np.ndarray,
+    config: AssetConfig,
+    initial_capital: float,
+    monthly_contribution: float,
+    months: Optional[np.ndarray],
+    years: Optional[np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    DCA + Yearly Rebalance: DCA Monthly, then back to target weights every January.
+
+    Runs the closed-form DCA over each segment between rebalance months and only
+    steps explicitly at the rebalances, i.e. O(years) Python iterations.
+    """
+    n = len(prices_qqq)
+    init_qqq, init_qld, init_cash = _initial_allocation(prices_qqq, prices_qld, config, initial_capital)
+    qqq_amount, qld_amount, cash_amount = _contribution_amounts(config, monthly_contribution)
+    qqq_fraction, qld_fraction, cash_fraction = config.qqq_fraction, config.qld_fraction, config.cash_fraction
+
+    # Shares bought each month (nothing in the first month)
+    qqq_bought = _shares_bought(qqq_amount, prices_qqq)
+    qld_bought = _shares_bought(qld_amount, prices_qld)
+    qqq_bought[0] = qld_bought[0] = 0.0
+
+    # Every January except the first month
+    rebalance_idx = np.flatnonzero((months == 1) & (np.arange(n) > 0))
+
+    qqq_shares = np.empty(n)
+    qld_shares = np.empty(n)
+    cash = np.empty(n)
+
+    start = 0
+    qqq, qld, balance = init_qqq, init_qld, init_cash
+    boundaries = [(end, True) for end in rebalance_idx.tolist()] + [(n - 1, False)]
+
+    for end, is_rebalance in boundaries:
+        # Holdings at `start` are final; months start+1..end only DCA
+        segment = slice(start, end + 1)
+        qqq_shares[segment] = np.cumsum(np.concatenate(([qqq], qqq_bought[start + 1:end + 1])))
+        qld_shares[segment] = np.cumsum(np.concatenate(([qld], qld_bought[start + 1:end + 1])))
+        cash[segment] = _compound_cash(end - start + 1, balance, cash_amount, config.cash_yield_annual)
+
+        if not is_rebalance:
+            break
+
+        # Rebalance to target weights at this month's prices
+        qqq_price = float(prices_qqq[end])
+        qld_price = float(prices_qld[end])
+        total_value = float(qqq_shares[end]) * qqq_price + float(qld_shares[end]) * qld_price + float(cash[end])
+
+        qqq = total_value * qqq_fraction / qqq_price if qqq_price > 0 else 0.0
+        qld = total_value * qld_fraction / qld_price if qld_price > 0 else 0.0
+        balance = total_value * cash_fraction
+
+        qqq_shares[end], qld_shares[end], cash[end] = qqq, qld, balance
+        start = end
+
+    return qqq_shares, qld_shares, cash
+
+
+def _kernel_smart_adjust(
+    prices_qqq: np.ndarray,
+    prices_qld: np.ndarray,
+    config: AssetConfig,
+    initial_capital: float,
+    monthly_contribution: float,
+    months: Optional[np.ndarray],
+    years: Optional[np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    DCA + Smart Adjust: DCA Monthly, then a QLD profit-taking / dip-buying step every December.
+
+    The December step depends on the cash and holdings left by previous ones, so the
+    whole timeline runs as one compiled monthly loop (smart_adjust_path).
+    """
+    n = len(prices_qqq)
+    init_qqq, init_qld, init_cash = _initial_allocation(prices_qqq, prices_qld, config, initial_capital)
+    qqq_amount, qld_amount, cash_amount = _contribution_amounts(config, monthly_contribution)
+    growth_factor = 1.0 + calculate_monthly_rate(config.cash_yield_annual)
+
+    qqq_shares = np.empty(n)
+    qld_shares = np.empty(n)
+    cash = np.empty(n)
+
+    smart_adjust_path(
+        prices_qqq, prices_qld,
+        months, years,
+        qqq_amount, qld_amount, cash_amount, growth_factor,
+        init_qqq, init_qld, init_cash,
+        qqq_shares, qld_shares, cash,
+    )
+
+    return qqq_shares, qld_shares, cash
+
+
+def _initial_allocation(
+    prices_qqq: np.ndarray,
+    prices_qld: np.ndarray,
+    config: AssetConfig,
+    capital: float,
+) -> Tuple[float, float, float]:
+    """Initial (qqq_shares, qld_shares, cash) for the first month's prices."""
+    qqq_allocation = capital * config.qqq_fraction
+    qld_allocation = capital * config.qld_fraction
+    cash_allocation = capital * config.cash_fraction
+
+    qqq_price = float(prices_qqq[0])
+    qld_price = float(prices_qld[0])
+
+    return (
+        qqq_allocation / qqq_price if qqq_price > 0 else 0.0,
+        qld_allocation / qld_price if qld_price > 0 else 0.0,
+        cash_allocation,
+    )
+
+
+def _contribution_amounts(config: AssetConfig, monthly_contribution: float) -> Tuple[float, float, float]:
+    """Monthly (qqq, qld, cash) purchase amounts; non-positive contributions buy nothing."""
+    contribution = monthly_contribution if monthly_contribution > 0 else 0.0
+    return contribution * config.qqq_fraction, contribution * config.qld_fraction, contribution * config.cash_fraction
+
+
+def _shares_bought(amount: float, prices: np.ndarray) -> np.ndarray:
+    """Shares bought for a fixed amount at each price (0 where price <= 0)."""
+    return np.divide(amount, prices, out=np.zeros_like(prices), where=prices > 0)
+
+
+def _compound_cash(n: int, init_cash: float, contribution: float, annual_yield: float) -> np.ndarray:
+    """
+    Cash balance per month under monthly compounding with a fixed deposit.
+
+    Closed form of c[k] = c[k-1] * (1 + r) + contribution, c[0] = init_cash.
+    """
+    k = np.arange(n, dtype=np.float64)
+    monthly_log_growth = math.log1p(annual_yield / 100) / 12
+
+    if monthly_log_growth == 0:
+        return init_cash + contribution * k
+
+    # (1 + r)^k and (1 + r)^k - 1 via exp/expm1 of k * log(1 + r)
+    monthly_rate = math.expm1(monthly_log_growth)
+    growth_minus_one = np.expm1(k * monthly_log_growth)
+    return init_cash * (growth_minus_one + 1) + contribution * growth_minus_one / monthly_rate
+
+
+_KERNELS: Dict[str, Callable[..., Tuple[np.ndarray, np.ndarray, np.ndarray]]] = {
+    'lump_sum': _kernel_lump_sum,
+    'dca_monthly': _kernel_dca_monthly,
+    'dca_yearly_rebalance': _kernel_dca_yearly_rebalance,
+    'smart_adjust': _kernel_smart_adjust,
+}
+
+# Kernels that schedule events by calendar month / track calendar years
+_NEEDS_MONTHS = frozenset({'dca_yearly_rebalance', 'smart_adjust'})
+_NEEDS_YEARS = frozenset({'smart_adjust'})
+
+VECTORIZED_STRATEGY_IDS = tuple(_KERNELS.keys())
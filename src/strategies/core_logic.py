@@ -2,9 +2,11 @@
 Core strategy implementations: Lump Sum, DCA, and Yearly Rebalance.
 All strategies are pure functions following the Strategy Protocol.
 """
-from typing import Dict, Protocol
+from typing import Protocol
+import numpy as np
 
 from src.domain.models import AssetConfig, PortfolioState
+from src.domain.finance_math import calculate_total_value
 
 
 class StrategyFunction(Protocol):
@@ -12,7 +14,7 @@ class StrategyFunction(Protocol):
     def __call__(
         self,
         current_state: PortfolioState,
-        market_prices: Dict[str, float],
+        market_prices: np.ndarray,
         config: AssetConfig,
         monthly_contribution: float,
         is_first_month: bool,
@@ -22,7 +24,7 @@ class StrategyFunction(Protocol):
 
 def strategy_lump_sum(
     state: PortfolioState,
-    prices: Dict[str, float],
+    prices: np.ndarray,
     config: AssetConfig,
     monthly_contribution: float,
     is_first_month: bool,
@@ -37,13 +39,13 @@ def strategy_lump_sum(
     """
     # Lump Sum does nothing after initial investment
     # Just update total value based on current prices
-    total_value = _calculate_total_value(state.shares, state.cash_balance, prices)
+    total_value = calculate_total_value(state.shares, state.cash_balance, prices)
     return state.with_updates(total_value=total_value)
 
 
 def strategy_dca_monthly(
     state: PortfolioState,
-    prices: Dict[str, float],
+    prices: np.ndarray,
     config: AssetConfig,
     monthly_contribution: float,
     is_first_month: bool,
@@ -57,23 +59,20 @@ def strategy_dca_monthly(
     - Asset ratios naturally drift with market movements
     """
     if is_first_month or monthly_contribution <= 0:
-        total_value = _calculate_total_value(state.shares, state.cash_balance, prices)
+        total_value = calculate_total_value(state.shares, state.cash_balance, prices)
         return state.with_updates(total_value=total_value)
 
     # Calculate new purchases based on allocation
-    qqq_amount = monthly_contribution * (config.qqq_weight / 100)
-    qld_amount = monthly_contribution * (config.qld_weight / 100)
-    cash_amount = monthly_contribution * (config.cash_weight / 100)
+    stock_amounts = monthly_contribution * config.stock_weights
+    cash_amount = monthly_contribution * config.cash_fraction
 
     # Buy shares
-    new_shares = state.shares.copy()
-    new_shares['QQQ'] = state.shares.get('QQQ', 0) + (qqq_amount / prices['QQQ'] if prices['QQQ'] > 0 else 0)
-    new_shares['QLD'] = state.shares.get('QLD', 0) + (qld_amount / prices['QLD'] if prices['QLD'] > 0 else 0)
+    new_shares = state.shares + _shares_for(stock_amounts, prices)
 
     # Add cash allocation
     new_cash = state.cash_balance + cash_amount
 
-    total_value = _calculate_total_value(new_shares, new_cash, prices)
+    total_value = calculate_total_value(new_shares, new_cash, prices)
 
     return state.with_updates(
         shares=new_shares,
@@ -84,7 +83,7 @@ def strategy_dca_monthly(
 
 def strategy_dca_yearly_rebalance(
     state: PortfolioState,
-    prices: Dict[str, float],
+    prices: np.ndarray,
     config: AssetConfig,
     monthly_contribution: float,
     is_first_month: bool,
@@ -108,22 +107,18 @@ def strategy_dca_yearly_rebalance(
 
 def _rebalance_portfolio(
     state: PortfolioState,
-    prices: Dict[str, float],
+    prices: np.ndarray,
     config: AssetConfig,
 ) -> PortfolioState:
     """Rebalance portfolio to target weights."""
-    total_value = _calculate_total_value(state.shares, state.cash_balance, prices)
+    total_value = calculate_total_value(state.shares, state.cash_balance, prices)
 
     # Calculate target allocations
-    target_qqq_value = total_value * (config.qqq_weight / 100)
-    target_qld_value = total_value * (config.qld_weight / 100)
-    target_cash = total_value * (config.cash_weight / 100)
+    target_stock_values = total_value * config.stock_weights
+    target_cash = total_value * config.cash_fraction
 
     # Calculate new share counts
-    new_shares = {
-        'QQQ': target_qqq_value / prices['QQQ'] if prices['QQQ'] > 0 else 0,
-        'QLD': target_qld_value / prices['QLD'] if prices['QLD'] > 0 else 0,
-    }
+    new_shares = _shares_for(target_stock_values, prices)
 
     return state.with_updates(
         shares=new_shares,
@@ -132,14 +127,6 @@ def _rebalance_portfolio(
     )
 
 
-def _calculate_total_value(
-    shares: Dict[str, float],
-    cash: float,
-    prices: Dict[str, float]
-) -> float:
-    """Calculate total portfolio value."""
-    stock_value = sum(
-        shares.get(ticker, 0) * prices.get(ticker, 0)
-        for ticker in ['QQQ', 'QLD']
-    )
-    return stock_value + cash
+def _shares_for(amounts: np.ndarray, prices: np.ndarray) -> np.ndarray:
+    """Shares bought with per-asset dollar amounts (0 where price <= 0)."""
+    return np.divide(amounts, prices, out=np.zeros(2), where=prices > 0)
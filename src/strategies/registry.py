@@ -1,28 +1,33 @@
 """
 Strategy registry - central registration of all available strategies.
 """
-from typing import Callable, Dict
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping
+import numpy as np
 
 from src.domain.models import AssetConfig, PortfolioState
 
 # Type alias for strategy functions
 StrategyFunc = Callable[
-    [PortfolioState, Dict[str, float], AssetConfig, float, bool],
+    [PortfolioState, np.ndarray, AssetConfig, float, bool],
     PortfolioState
 ]
 
 # Internal registry
 _strategies: Dict[str, StrategyFunc] = {}
 
+# Read-only live view handed out to callers (no copy per call)
+_strategies_view: Mapping[str, StrategyFunc] = MappingProxyType(_strategies)
+
 
 def register_strategy(name: str, func: StrategyFunc) -> None:
     """Register a strategy function."""
     _strategies[name] = func
 
 
-def get_all_strategies() -> Dict[str, StrategyFunc]:
-    """Get all registered strategies."""
-    return _strategies.copy()
+def get_all_strategies() -> Mapping[str, StrategyFunc]:
+    """Get all registered strategies as a read-only view (reflects later registrations)."""
+    return _strategies_view
 
 
 def get_strategy(name: str) -> StrategyFunc:
@@ -2,14 +2,16 @@
 Special strategy: Smart Adjust (Strategy 4).
 Implements profit-taking and dip-buying logic based on QLD annual performance.
 """
-from typing import Dict
+from typing import Any, Mapping
+import numpy as np
 
-from src.domain.models import AssetConfig, PortfolioState
+from src.domain.models import AssetConfig, PortfolioState, IDX_QQQ, IDX_QLD
+from src.domain.finance_math import calculate_total_value
 
 
 def strategy_smart_adjust(
     state: PortfolioState,
-    prices: Dict[str, float],
+    prices: np.ndarray,
     config: AssetConfig,
     monthly_contribution: float,
     is_first_month: bool,
@@ -28,94 +30,109 @@ def strategy_smart_adjust(
     - year_qld_inflows: Total QLD purchases during the year
     - last_year: Track year transitions
     """
-    memory = dict(state.strategy_memory)
+    memory = state.strategy_memory
     current_year = state.date.year
     current_month = state.date.month
 
-    # Calculate current QLD value
-    qld_value = state.shares.get('QLD', 0) * prices.get('QLD', 0)
-
-    # Handle year transition - reset tracking
-    if memory.get('last_year') != current_year:
-        memory['start_year_qld_value'] = qld_value
-        memory['year_qld_inflows'] = 0.0
-        memory['last_year'] = current_year
+    # Year-to-date QLD tracking from strategy_memory, kept in locals until the end
+    new_year = memory.get('last_year') != current_year
+    if new_year:
+        # Handle year transition - reset tracking at the current QLD value
+        start_qld_value = state.shares[IDX_QLD] * prices[IDX_QLD]
+        qld_inflows = 0.0
+    else:
+        start_qld_value = memory.get('start_year_qld_value', 0)
+        qld_inflows = memory.get('year_qld_inflows', 0)
 
     # Perform DCA (same as strategy 2)
-    new_shares = dict(state.shares)
+    qqq_shares, qld_shares = state.shares.tolist()
     new_cash = state.cash_balance
+    traded = False
 
     if not is_first_month and monthly_contribution > 0:
-        qqq_amount = monthly_contribution * (config.qqq_weight / 100)
-        qld_amount = monthly_contribution * (config.qld_weight / 100)
-        cash_amount = monthly_contribution * (config.cash_weight / 100)
+        qqq_amount = monthly_contribution * config.qqq_fraction
+        qld_amount = monthly_contribution * config.qld_fraction
+        cash_amount = monthly_contribution * config.cash_fraction
 
         # Buy shares
-        if prices['QQQ'] > 0:
-            new_shares['QQQ'] = new_shares.get('QQQ', 0) + (qqq_amount / prices['QQQ'])
-        if prices['QLD'] > 0:
-            new_shares['QLD'] = new_shares.get('QLD', 0) + (qld_amount / prices['QLD'])
+        if prices[IDX_QQQ] > 0:
+            qqq_shares += qqq_amount / prices[IDX_QQQ]
+            traded = True
+        if prices[IDX_QLD] > 0:
+            qld_shares += qld_amount / prices[IDX_QLD]
+            traded = True
             # Track QLD inflows for profit calculation
-            memory['year_qld_inflows'] = memory.get('year_qld_inflows', 0) + qld_amount
+            qld_inflows += qld_amount
 
         new_cash += cash_amount
 
-    # Execute smart adjust logic at year end (December)
-    if current_month == 12 and not is_first_month:
-        # Calculate current QLD value after DCA
-        current_qld_value = new_shares.get('QLD', 0) * prices.get('QLD', 0)
+    # Only allocate new memory when this month changed it; year-end logic below never does
+    if new_year or qld_inflows != memory.get('year_qld_inflows', 0):
+        memory = {
+            'start_year_qld_value': start_qld_value,
+            'year_qld_inflows': qld_inflows,
+            'last_year': current_year,
+        }
 
-        # Calculate QLD profit/loss for the year
-        start_qld_value = memory.get('start_year_qld_value', 0)
-        qld_inflows = memory.get('year_qld_inflows', 0)
-        qld_profit = current_qld_value - (start_qld_value + qld_inflows)
+    # Smart adjust only runs at year end (December); every other month is plain DCA
+    if current_month != 12 or is_first_month:
+        return _updated_state(state, prices, qqq_shares, qld_shares, new_cash, traded, memory)
+
+    # Calculate current QLD value after DCA
+    current_qld_value = qld_shares * prices[IDX_QLD]
+
+    # Calculate QLD profit/loss for the year
+    qld_profit = current_qld_value - (start_qld_value + qld_inflows)
+
+    if qld_profit > 0:
+        # Profit: Sell 1/3 of profit, move to Cash
+        profit_to_take = qld_profit / 3
 
-        if qld_profit > 0:
-            # Profit: Sell 1/3 of profit, move to Cash
-            profit_to_take = qld_profit / 3
+        if prices[IDX_QLD] > 0 and profit_to_take > 0:
+            shares_to_sell = profit_to_take / prices[IDX_QLD]
+            # Ensure we don't sell more than we have
+            shares_to_sell = min(shares_to_sell, qld_shares)
 
-            if prices['QLD'] > 0 and profit_to_take > 0:
-                shares_to_sell = profit_to_take / prices['QLD']
-                # Ensure we don't sell more than we have
-                shares_to_sell = min(shares_to_sell, new_shares.get('QLD', 0))
+            qld_shares -= shares_to_sell
+            new_cash += shares_to_sell * prices[IDX_QLD]
+            traded = True
 
-                new_shares['QLD'] = new_shares.get('QLD', 0) - shares_to_sell
-                new_cash += shares_to_sell * prices['QLD']
+    else:
+        # Loss or flat: Buy QLD worth 2% of total portfolio using Cash
+        total_value = qqq_shares * prices[IDX_QQQ] + qld_shares * prices[IDX_QLD] + new_cash
+        buy_amount = total_value * 0.02
 
-        else:
-            # Loss or flat: Buy QLD worth 2% of total portfolio using Cash
-            total_value = _calculate_total_value(new_shares, new_cash, prices)
-            buy_amount = total_value * 0.02
+        # Can only use available cash
+        buy_amount = min(buy_amount, new_cash)
 
-            # Can only use available cash
-            buy_amount = min(buy_amount, new_cash)
+        if buy_amount > 0 and prices[IDX_QLD] > 0:
+            shares_to_buy = buy_amount / prices[IDX_QLD]
+            qld_shares += shares_to_buy
+            new_cash -= buy_amount
+            traded = True
 
-            if buy_amount > 0 and prices['QLD'] > 0:
-                shares_to_buy = buy_amount / prices['QLD']
-                new_shares['QLD'] = new_shares.get('QLD', 0) + shares_to_buy
-                new_cash -= buy_amount
+    return _updated_state(state, prices, qqq_shares, qld_shares, new_cash, traded, memory)
 
+
+def _updated_state(
+    state: PortfolioState,
+    prices: np.ndarray,
+    qqq_shares: float,
+    qld_shares: float,
+    cash: float,
+    traded: bool,
+    memory: Mapping[str, Any],
+) -> PortfolioState:
+    """Build the month's resulting state, reusing the incoming shares array when nothing traded."""
     # Ensure cash never goes negative
-    new_cash = max(0, new_cash)
+    cash = max(0, cash)
 
-    total_value = _calculate_total_value(new_shares, new_cash, prices)
+    new_shares = np.array((qqq_shares, qld_shares)) if traded else state.shares
+    total_value = calculate_total_value(new_shares, cash, prices)
 
     return state.with_updates(
         shares=new_shares,
-        cash_balance=new_cash,
+        cash_balance=cash,
         total_value=total_value,
         strategy_memory=memory,
     )
-
-
-def _calculate_total_value(
-    shares: Dict[str, float],
-    cash: float,
-    prices: Dict[str, float]
-) -> float:
-    """Calculate total portfolio value."""
-    stock_value = sum(
-        shares.get(ticker, 0) * prices.get(ticker, 0)
-        for ticker in ['QQQ', 'QLD']
-    )
-    return stock_value + cash
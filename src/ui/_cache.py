@@ -0,0 +1,26 @@
+"""
+Streamlit caching for render helpers that take simulation results.
+"""
+from typing import Any, Tuple
+import streamlit as st
+
+from src.domain.models import SimulationResult
+
+
+def _result_fingerprint(result: SimulationResult) -> Tuple[Any, ...]:
+    """Everything the chart renderers read from a result, in a form Streamlit can hash."""
+    return (
+        result.strategy_name,
+        result.dates_np.tobytes(),
+        result.values_np.tobytes(),
+        result.cash_np.tobytes(),
+    )
+
+
+# Decorator for functions of List[SimulationResult]; reruns with equal results reuse the cached output.
+# Each decorated function keeps at most max_entries outputs so a long-running server does not grow unbounded.
+cache_render = st.cache_data(
+    show_spinner=False,
+    max_entries=16,
+    hash_funcs={SimulationResult: _result_fingerprint},
+)
@@ -2,12 +2,51 @@
 Plotly chart components for visualization.
 """
 from typing import List
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from src.domain.models import SimulationResult
-
-
+from src.ui._cache import cache_render
+
+try:
+    from plotly_resampler import FigureResampler
+except ImportError:  # pragma: no cover - optional dependency
+    FigureResampler = None
+
+# Trace colors, cycled per strategy
+_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd')
+
+# Layout shared by every chart
+_BASE_LAYOUT = dict(
+    hovermode='x unified',
+    legend=dict(
+        yanchor="top",
+        y=0.99,
+        xanchor="left",
+        x=0.01,
+    ),
+    template="plotly_white",
+)
+
+# Longest series sent to the browser as-is; longer ones are downsampled when plotly-resampler is installed
+_MAX_SHOWN_POINTS = 1000
+
+
+def _new_figure(results: List[SimulationResult]) -> go.Figure:
+    """Create a figure, downsampling server-side if any series exceeds _MAX_SHOWN_POINTS."""
+    longest = max((len(result.values_np) for result in results), default=0)
+    if FigureResampler is not None and longest > _MAX_SHOWN_POINTS:
+        return FigureResampler(
+            go.Figure(),
+            default_n_shown_samples=_MAX_SHOWN_POINTS,
+            show_mean_aggregation_size=False,
+            resampled_trace_prefix_suffix=('', ''),
+        )
+    return go.Figure()
+
+
+@cache_render
 def render_portfolio_growth(results: List[SimulationResult]) -> go.Figure:
     """
     Render portfolio growth comparison chart.
@@ -18,20 +57,17 @@ def render_portfolio_growth(results: List[SimulationResult]) -> go.Figure:
     Returns:
         Plotly Figure with line chart comparing all strategies
     """
-    fig = go.Figure()
-
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+    fig = _new_figure(results)
 
+    traces = []
     for i, result in enumerate(results):
-        dates = [state.date for state in result.history]
-        values = [state.total_value for state in result.history]
-
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=values,
+        # SVG trace: the range slider below does not draw WebGL traces
+        traces.append(go.Scatter(
+            x=result.dates_np,
+            y=result.values_np,
             mode='lines',
             name=result.strategy_name,
-            line=dict(color=colors[i % len(colors)], width=2),
+            line=dict(color=_COLORS[i % len(_COLORS)], width=2),
             hovertemplate=(
                 f"<b>{result.strategy_name}</b><br>"
                 "Date: %{x}<br>"
@@ -40,18 +76,14 @@ def render_portfolio_growth(results: List[SimulationResult]) -> go.Figure:
             ),
         ))
 
+    # One batched add instead of a validation pass per trace
+    fig.add_traces(traces)
+
     fig.update_layout(
         title="Portfolio Growth Over Time",
         xaxis_title="Date",
         yaxis_title="Portfolio Value ($)",
-        hovermode='x unified',
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01,
-        ),
-        template="plotly_white",
+        **_BASE_LAYOUT,
     )
 
     # Add range slider
@@ -88,6 +120,7 @@ def render_portfolio_growth(results: List[SimulationResult]) -> go.Figure:
     return fig
 
 
+@cache_render
 def render_cash_exposure(results: List[SimulationResult]) -> go.Figure:
     """
     Render cash exposure chart, particularly useful for Smart Adjust strategy.
@@ -98,27 +131,20 @@ def render_cash_exposure(results: List[SimulationResult]) -> go.Figure:
     Returns:
         Plotly Figure showing cash percentage over time
     """
-    fig = go.Figure()
-
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+    fig = _new_figure(results)
 
+    traces = []
     for i, result in enumerate(results):
-        dates = [state.date for state in result.history]
-        cash_pcts = []
-
-        for state in result.history:
-            if state.total_value > 0:
-                cash_pct = (state.cash_balance / state.total_value) * 100
-            else:
-                cash_pct = 0
-            cash_pcts.append(cash_pct)
-
-        fig.add_trace(go.Scatter(
-            x=dates,
+        values = result.values_np
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cash_pcts = np.where(values > 0, result.cash_np / values * 100, 0.0)
+
+        traces.append(go.Scattergl(
+            x=result.dates_np,
             y=cash_pcts,
             mode='lines',
             name=result.strategy_name,
-            line=dict(color=colors[i % len(colors)], width=2),
+            line=dict(color=_COLORS[i % len(_COLORS)], width=2),
             fill='tozeroy' if result.strategy_name == "DCA + Smart Adjust" else None,
             hovertemplate=(
                 f"<b>{result.strategy_name}</b><br>"
@@ -128,24 +154,20 @@ def render_cash_exposure(results: List[SimulationResult]) -> go.Figure:
             ),
         ))
 
+    fig.add_traces(traces)
+
     fig.update_layout(
         title="Cash Allocation Over Time",
         xaxis_title="Date",
         yaxis_title="Cash Percentage (%)",
-        hovermode='x unified',
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01,
-        ),
-        template="plotly_white",
+        **_BASE_LAYOUT,
         yaxis=dict(range=[0, 100]),
     )
 
     return fig
 
 
+@cache_render
 def render_drawdown_chart(results: List[SimulationResult]) -> go.Figure:
     """
     Render drawdown chart for all strategies.
@@ -156,33 +178,23 @@ def render_drawdown_chart(results: List[SimulationResult]) -> go.Figure:
     Returns:
         Plotly Figure showing drawdowns over time
     """
-    fig = go.Figure()
-
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+    fig = _new_figure(results)
 
+    traces = []
     for i, result in enumerate(results):
-        dates = [state.date for state in result.history]
-        values = [state.total_value for state in result.history]
-
-        # Calculate running drawdown
-        peak = values[0]
-        drawdowns = []
-
-        for value in values:
-            if value > peak:
-                peak = value
-            if peak > 0:
-                dd = (value - peak) / peak * 100
-            else:
-                dd = 0
-            drawdowns.append(dd)
-
-        fig.add_trace(go.Scatter(
-            x=dates,
+        values = result.values_np
+
+        # Calculate running drawdown against the running peak
+        peaks = np.maximum.accumulate(values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdowns = np.where(peaks > 0, (values - peaks) / peaks * 100, 0.0)
+
+        traces.append(go.Scattergl(
+            x=result.dates_np,
             y=drawdowns,
             mode='lines',
             name=result.strategy_name,
-            line=dict(color=colors[i % len(colors)], width=2),
+            line=dict(color=_COLORS[i % len(_COLORS)], width=2),
             fill='tozeroy',
             hovertemplate=(
                 f"<b>{result.strategy_name}</b><br>"
@@ -192,18 +204,13 @@ def render_drawdown_chart(results: List[SimulationResult]) -> go.Figure:
             ),
         ))
 
+    fig.add_traces(traces)
+
     fig.update_layout(
         title="Portfolio Drawdown",
         xaxis_title="Date",
         yaxis_title="Drawdown (%)",
-        hovermode='x unified',
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01,
-        ),
-        template="plotly_white",
+        **_BASE_LAYOUT,
     )
 
     return fig
@@ -2,11 +2,23 @@
 Results display components for Streamlit.
 """
 from typing import List
+import numpy as np
 import streamlit as st
 import pandas as pd
 
 from src.domain.models import SimulationResult
 
+# Display format of each numeric column in the comparison table
+_COMPARISON_FORMATS = {
+    "Final Balance": "${:,.0f}",
+    "Total Invested": "${:,.0f}",
+    "CAGR (%)": "{:.2f}",
+    "IRR (%)": "{:.2f}",
+    "Max Drawdown (%)": "{:.1f}",
+    "Volatility (%)": "{:.1f}",
+    "Sharpe Ratio": "{:.2f}",
+}
+
 
 def render_results_summary(results: List[SimulationResult]) -> None:
     """
@@ -37,29 +49,26 @@ def render_results_summary(results: List[SimulationResult]) -> None:
             else:
                 st.info(f"**{result.strategy_name}**")
 
-            final_balance = result.metrics.get('final_balance', 0)
-            irr = result.metrics.get('irr', 0)
-            cagr = result.metrics.get('cagr', 0)
-            max_dd = result.metrics.get('max_drawdown', 0)
+            formatted = result.formatted_metrics
 
             st.metric(
                 label="Final Balance",
-                value=f"${final_balance:,.0f}",
+                value=formatted['final_balance'],
             )
 
             st.metric(
                 label="IRR",
-                value=f"{irr:.2f}%",
+                value=formatted['irr'],
             )
 
             st.metric(
                 label="CAGR",
-                value=f"{cagr:.2f}%",
+                value=formatted['cagr'],
             )
 
             st.metric(
                 label="Max Drawdown",
-                value=f"{max_dd:.1f}%",
+                value=formatted['max_drawdown'],
             )
 
 
@@ -72,30 +81,34 @@ def render_comparison_table(results: List[SimulationResult]) -> None:
     """
     st.subheader("📊 Detailed Comparison")
 
-    data = []
-    for result in results:
-        metrics = result.metrics
-        data.append({
-            "Strategy": result.strategy_name,
-            "Final Balance": f"${metrics.get('final_balance', 0):,.0f}",
-            "Total Invested": f"${result.total_invested:,.0f}",
-            "CAGR (%)": f"{metrics.get('cagr', 0):.2f}",
-            "IRR (%)": f"{metrics.get('irr', 0):.2f}",
-            "Max Drawdown (%)": f"{metrics.get('max_drawdown', 0):.1f}",
-            "Volatility (%)": f"{metrics.get('volatility', 0):.1f}",
-            "Sharpe Ratio": f"{metrics.get('sharpe_ratio', 0):.2f}",
-        })
-
-    df = pd.DataFrame(data)
-
-    # Style the dataframe
+    df = _comparison_frame(results)
+
+    # Format for display only; the columns stay numeric so they sort as numbers
     st.dataframe(
-        df,
+        df.style.format(_COMPARISON_FORMATS),
         use_container_width=True,
         hide_index=True,
     )
 
 
+def _comparison_frame(results: List[SimulationResult]) -> pd.DataFrame:
+    """Build the comparison table, one row per strategy."""
+    def metric_column(key: str) -> np.ndarray:
+        return np.array([result.metrics.get(key, 0) for result in results], dtype=np.float64)
+
+    # Built column by column so every numeric column is float64 from the start
+    return pd.DataFrame({
+        "Strategy": [result.strategy_name for result in results],
+        "Final Balance": metric_column('final_balance'),
+        "Total Invested": np.array([result.total_invested for result in results], dtype=np.float64),
+        "CAGR (%)": metric_column('cagr'),
+        "IRR (%)": metric_column('irr'),
+        "Max Drawdown (%)": metric_column('max_drawdown'),
+        "Volatility (%)": metric_column('volatility'),
+        "Sharpe Ratio": metric_column('sharpe_ratio'),
+    })
+
+
 def render_strategy_details(result: SimulationResult) -> None:
     """
     Render detailed view for a single strategy.
@@ -127,7 +140,7 @@ def render_strategy_details(result: SimulationResult) -> None:
     total = final_state.total_value
 
     if total > 0:
-        for ticker, shares in final_state.shares.items():
+        for ticker, shares in final_state.shares_dict.items():
             # We'd need prices to show actual values
             st.write(f"- {ticker}: {shares:.4f} shares")
 
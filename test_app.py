@@ -5,6 +5,8 @@ from src.data_loader import load_json, load_data
 from src.strategies import get_all_strategies
 from src.simulation import run_backtest
 from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
 # Test models
 config = AssetConfig(qqq_weight=40.0, qld_weight=40.0, cash_weight=20.0, cash_yield_annual=4.0)
@@ -29,10 +31,10 @@ print(f'Data loaded: {len(data)} months from {data.index[0].date()} to {data.ind
 strategies = get_all_strategies()
 print(f'Strategies registered: {list(strategies.keys())}')
 
-# Run a quick backtest
-print('\nBacktest Results:')
-for name, strategy_func in strategies.items():
-    result = run_backtest(
+# Run a quick backtest, one strategy per thread (same as app.py)
+def run_strategy(item):
+    name, strategy_func = item
+    return run_backtest(
         market_df=data,
         strategy_func=strategy_func,
         strategy_name=name,
@@ -40,8 +42,34 @@ for name, strategy_func in strategies.items():
         initial_capital=100000,
         monthly_contribution=1000,
     )
+
+
+print('\nBacktest Results:')
+with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+    results = list(executor.map(run_strategy, strategies.items()))
+
+for name, result in zip(strategies, results):
     final = result.metrics.get('final_balance', 0)
     irr_val = result.metrics.get('irr', 0)
     print(f'  {name}: Final=${final:,.0f}, IRR={irr_val:.2f}%')
 
+# Built-in strategies run as vectorized kernels; wrapping the function forces the
+# generic monthly loop, which must produce the same path
+print('\nKernel vs generic loop:')
+kernel_cases = [
+    (config, 100000, 1000),
+    (AssetConfig(qqq_weight=0.0, qld_weight=100.0, cash_weight=0.0, cash_yield_annual=0.0), 5000, 0),
+    (AssetConfig(qqq_weight=70.0, qld_weight=10.0, cash_weight=20.0, cash_yield_annual=5.0), 0, 250),
+]
+for name, strategy_func in strategies.items():
+    for case_config, capital, contribution in kernel_cases:
+        kernel = run_backtest(data, strategy_func, name, case_config, capital, contribution)
+        generic = run_backtest(
+            data, lambda *args, func=strategy_func: func(*args), name, case_config, capital, contribution
+        )
+        assert np.allclose(kernel.values_np, generic.values_np, rtol=1e-10, atol=1e-8), name
+        assert np.allclose(kernel.cash_np, generic.cash_np, rtol=1e-10, atol=1e-8), name
+        assert np.allclose(kernel.shares_np, generic.shares_np, rtol=1e-10, atol=1e-8), name
+    print(f'  {name}: OK')
+
 print('\nAll tests passed!')